@@ -4,12 +4,13 @@ from __future__ import annotations
 import logging
 from datetime import timedelta
 
+import aiohttp
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 
-from .api import SmallTVApi, SmallTVApiError
+from .api import SmallTVApi
 from .const import (
     DOMAIN,
     CONF_HOST,
@@ -17,7 +18,7 @@ from .const import (
     DEFAULT_REFRESH_INTERVAL,
     PLATFORMS,
 )
-from .coordinator import SmallTVUltraCoordinator
+from .coordinator import SmallTVInfoCoordinator, SmallTVUltraCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,17 +26,22 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up SmallTV Ultra from a config entry."""
     host: str = entry.data[CONF_HOST]
-    session = async_get_clientsession(hass)
+    # Dedicated session: keep-alive to the single device instead of a fresh
+    # TCP handshake per poll on HA's shared session
+    connector = aiohttp.TCPConnector(
+        limit_per_host=4,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True,
+        force_close=False,
+    )
+    session = aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=10),
+    )
+    # Also runs when setup fails below, so the session never leaks
+    entry.async_on_unload(session.close)
     api = SmallTVApi(host, session)
 
-    # Verify the device is reachable before proceeding
-    try:
-        await api.get_info()
-    except SmallTVApiError as err:
-        raise ConfigEntryNotReady(
-            f"Cannot connect to SmallTV Ultra at {host}: {err}"
-        ) from err
-
     refresh_interval: int = int(
         entry.options.get(CONF_REFRESH_INTERVAL, DEFAULT_REFRESH_INTERVAL)
     )
@@ -47,13 +53,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_interval=timedelta(seconds=refresh_interval),
     )
 
-    # Perform first refresh (raises ConfigEntryNotReady on failure)
+    entry.async_on_unload(coordinator.async_shutdown)
+
+    # Firmware info changes rarely – polled on its own slow coordinator
+    info_coordinator = SmallTVInfoCoordinator(hass=hass, api=api)
+
+    # Perform first refresh (raises ConfigEntryNotReady on failure); the
+    # /v.json fetch doubles as the reachability check
+    await info_coordinator.async_config_entry_first_refresh()
     await coordinator.async_config_entry_first_refresh()
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "status": coordinator,
+        "info": info_coordinator,
+    }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # DeviceInfo.sw_version is only read when the device is first registered;
+    # push later firmware changes from the info coordinator to the registry
+    @callback
+    def _async_sync_sw_version() -> None:
+        device_registry = dr.async_get(hass)
+        device = device_registry.async_get_device(
+            identifiers={(DOMAIN, entry.entry_id)}
+        )
+        sw_version = info_coordinator.firmware_version
+        if device is not None and device.sw_version != sw_version:
+            device_registry.async_update_device(device.id, sw_version=sw_version)
+
+    # Subscribing is also what keeps the info coordinator polling
+    entry.async_on_unload(info_coordinator.async_add_listener(_async_sync_sw_version))
+
     # Reload entry when options change (new cameras / intervals / mode)
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
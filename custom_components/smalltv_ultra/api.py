@@ -1,22 +1,51 @@
 """SmallTV Ultra HTTP API client."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
 from typing import Any
+from urllib.parse import quote
 
 import aiohttp
+import orjson
 
 
 class SmallTVApiError(Exception):
-    """Raised when a SmallTV Ultra API call fails."""
+    """Raised when a SmallTV Ultra API call fails (HTTP status, transport or timeout)."""
 
 
 class SmallTVApi:
     """Async HTTP client for the SmallTV Ultra stock firmware API."""
 
+    _TIMEOUT_SHORT = aiohttp.ClientTimeout(total=10)
+    _TIMEOUT_UPLOAD = aiohttp.ClientTimeout(total=30)
+    # HEAD is only a shortcut – give up quickly and fall back to the GET
+    _TIMEOUT_HEAD = aiohttp.ClientTimeout(total=3)
+
+    # Fixed multipart skeleton for upload_image()
+    _BOUNDARY = "----SmallTVBoundary7MA4YWxkTrZu0gW"
+    _UPLOAD_CONTENT_TYPE = f"multipart/form-data; boundary={_BOUNDARY}"
+    _PART_HEADER_FMT = (
+        f"--{_BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        "Content-Type: {content_type}\r\n"
+        "\r\n"
+    )
+    _TRAILER = f"\r\n--{_BOUNDARY}--\r\n".encode()
+
     def __init__(self, host: str, session: aiohttp.ClientSession) -> None:
         self._host = host
         self._session = session
         self._base = f"http://{host}"
+        # Fixed endpoint URLs, built once
+        self._url_info = f"{self._base}/v.json"
+        self._url_app = f"{self._base}/app.json"
+        self._url_album = f"{self._base}/album.json"
+        self._url_storage = f"{self._base}/space.json"
+        self._url_set = f"{self._base}/set"
+        self._url_upload = f"{self._base}/doUpload?dir=/image/"
+        # URL → (ETag, Last-Modified, last parsed body) for conditional GETs
+        self._cache: dict[str, tuple[str | None, str | None, dict[str, Any]]] = {}
 
     # ------------------------------------------------------------------ #
     # Status / info                                                        #
@@ -24,19 +53,19 @@ class SmallTVApi:
 
     async def get_info(self) -> dict[str, Any]:
         """GET /v.json → {"m": "SmallTV-Ultra", "v": "Ultra-V9.0.45"}."""
-        return await self._get_json("/v.json")
+        return await self._get_json_if_modified(self._url_info)
 
     async def get_app_info(self) -> dict[str, Any]:
         """GET /app.json → {"theme": 3}."""
-        return await self._get_json("/app.json")
+        return await self._get_json_if_modified(self._url_app)
 
     async def get_album_info(self) -> dict[str, Any]:
         """GET /album.json → {"autoplay": 1, "i_i": 5}."""
-        return await self._get_json("/album.json")
+        return await self._get_json_if_modified(self._url_album)
 
     async def get_storage(self) -> dict[str, Any]:
         """GET /space.json → {"total": ..., "free": ...} (bytes)."""
-        return await self._get_json("/space.json")
+        return await self._get_json_if_modified(self._url_storage)
 
     # ------------------------------------------------------------------ #
     # Settings  (GET /set?...)                                             #
@@ -71,32 +100,41 @@ class SmallTVApi:
     # ------------------------------------------------------------------ #
 
     async def upload_image(
-        self, filename: str, data: bytes, content_type: str = "image/jpeg"
+        self,
+        filename: str,
+        data: bytes | bytearray | memoryview,
+        content_type: str = "image/jpeg",
     ) -> None:
         """POST /doUpload?dir=/image/ – upload an image file (JPEG or GIF).
 
         Builds the multipart body manually to avoid the aiohttp FormData
         bug that emits a duplicate Content-Length header, which the ESP8266
-        rejects with HTTP 400.
+        rejects with HTTP 400 (aiohttp.MultipartWriter adds per-part headers
+        with the same effect).  The parts are streamed in sequence with an
+        explicit Content-Length, and the image is passed on as a memoryview,
+        so its bytes are never copied into a second buffer.
         """
-        boundary = "----SmallTVBoundary7MA4YWxkTrZu0gW"
-        part_header = (
-            f"--{boundary}\r\n"
-            f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
-            f"Content-Type: {content_type}\r\n"
-            f"\r\n"
+        part_header = self._PART_HEADER_FMT.format(
+            filename=filename, content_type=content_type
         ).encode()
-        body = part_header + data + f"\r\n--{boundary}--\r\n".encode()
+        trailer = self._TRAILER
+        payload = memoryview(data).cast("B")
+
+        async def body() -> AsyncIterator[bytes | memoryview]:
+            yield part_header
+            yield payload
+            yield trailer
 
         headers = {
-            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Type": self._UPLOAD_CONTENT_TYPE,
+            "Content-Length": str(len(part_header) + payload.nbytes + len(trailer)),
         }
         try:
             async with self._session.post(
-                f"{self._base}/doUpload?dir=/image/",
-                data=body,
+                self._url_upload,
+                data=body(),
                 headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30),
+                timeout=self._TIMEOUT_UPLOAD,
             ) as resp:
                 if resp.status != 200:
                     raise SmallTVApiError(
@@ -107,42 +145,92 @@ class SmallTVApi:
             # Content-Length headers.  Newer aiohttp raises a synthetic 400 error
             # when it encounters this, even though the upload succeeded on the
             # device.  Treat this specific case as success.
-            if "Duplicate Content-Length" not in str(exc):
+            if exc.status != 400 or "Duplicate Content-Length" not in exc.message:
                 raise SmallTVApiError(f"Upload request error: {exc}") from exc
         except aiohttp.ClientError as exc:
             raise SmallTVApiError(f"Upload request error: {exc}") from exc
+        except asyncio.TimeoutError as exc:
+            raise SmallTVApiError(f"Upload of {filename} timed out") from exc
 
     # ------------------------------------------------------------------ #
     # Internal helpers                                                     #
     # ------------------------------------------------------------------ #
 
-    async def _get_json(self, path: str) -> dict[str, Any]:
+    async def _get_json_if_modified(self, url: str) -> dict[str, Any]:
+        """Return the cached body if a HEAD shows Last-Modified unchanged.
+
+        Only probes once a Last-Modified value is known for *url*; any HEAD
+        failure (including a timeout) or mismatch falls through to the
+        conditional GET.
+        """
+        _, last_modified, cached = self._cache.get(url, (None, None, None))
+        if cached is not None and last_modified:
+            try:
+                async with self._session.head(
+                    url,
+                    timeout=self._TIMEOUT_HEAD,
+                ) as resp:
+                    if (
+                        resp.status == 200
+                        and resp.headers.get("Last-Modified") == last_modified
+                    ):
+                        return cached
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass  # Fall back to a full GET below
+        return await self._get_json(url)
+
+    async def _get_json(self, url: str) -> dict[str, Any]:
+        """GET a JSON endpoint, revalidating against the last response.
+
+        Sends If-None-Match / If-Modified-Since when the previous response
+        carried ETag / Last-Modified, and returns the cached body on HTTP 304.
+        """
+        etag, last_modified, cached = self._cache.get(url, (None, None, None))
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
         try:
             async with self._session.get(
-                f"{self._base}{path}",
-                timeout=aiohttp.ClientTimeout(total=10),
+                url,
+                headers=headers,
+                timeout=self._TIMEOUT_SHORT,
             ) as resp:
+                if resp.status == 304 and cached is not None:
+                    return cached
                 if resp.status != 200:
                     raise SmallTVApiError(
-                        f"GET {path} returned HTTP {resp.status}"
+                        f"GET {url} returned HTTP {resp.status}"
                     )
                 # content_type=None: device may return text/plain
-                return await resp.json(content_type=None)
+                data = await resp.json(content_type=None, loads=orjson.loads)
+                self._cache[url] = (
+                    resp.headers.get("ETag"),
+                    resp.headers.get("Last-Modified"),
+                    data,
+                )
+                return data
         except aiohttp.ClientError as exc:
-            raise SmallTVApiError(f"Request error for {path}: {exc}") from exc
+            raise SmallTVApiError(f"Request error for {url}: {exc}") from exc
+        except asyncio.TimeoutError as exc:
+            raise SmallTVApiError(f"Request to {url} timed out") from exc
 
     async def _set(self, **params: Any) -> None:
         """Call GET /set?key=value&... and assert HTTP 200."""
-        str_params = {k: str(v) for k, v in params.items()}
+        # Values are ints or short ASCII paths; keep "/" literal for img/gif
+        qs = "&".join(f"{k}={quote(str(v), safe='/')}" for k, v in params.items())
         try:
             async with self._session.get(
-                f"{self._base}/set",
-                params=str_params,
-                timeout=aiohttp.ClientTimeout(total=10),
+                f"{self._url_set}?{qs}",
+                timeout=self._TIMEOUT_SHORT,
             ) as resp:
                 if resp.status != 200:
                     raise SmallTVApiError(
-                        f"GET /set?{str_params} returned HTTP {resp.status}"
+                        f"GET /set?{qs} returned HTTP {resp.status}"
                     )
         except aiohttp.ClientError as exc:
             raise SmallTVApiError(f"Request error for /set: {exc}") from exc
+        except asyncio.TimeoutError as exc:
+            raise SmallTVApiError(f"GET /set?{qs} timed out") from exc
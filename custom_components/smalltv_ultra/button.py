@@ -17,7 +17,7 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    coordinator: SmallTVUltraCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: SmallTVUltraCoordinator = hass.data[DOMAIN][entry.entry_id]["status"]
     async_add_entities([SmallTVForceRefreshButton(coordinator, entry)])
 
 
@@ -36,10 +36,7 @@ class SmallTVForceRefreshButton(
         super().__init__(coordinator)
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_force_refresh"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self._entry.entry_id)})
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry.entry_id)})
 
     async def async_press(self) -> None:
         """Handle button press – force coordinator refresh."""
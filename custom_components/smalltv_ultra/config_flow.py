@@ -2,7 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+
 import aiohttp
+import orjson
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -19,27 +23,169 @@ from .const import (
     CONF_REFRESH_INTERVAL,
     CONF_CYCLE_INTERVAL,
     CONF_MODE,
+    CONF_IMAGE_FORMAT,
     CONF_DEVICE_TYPE,
     DEVICE_ULTRA,
     DEVICE_PRO,
     DEFAULT_REFRESH_INTERVAL,
     DEFAULT_CYCLE_INTERVAL,
     DEFAULT_MODE,
+    DEFAULT_IMAGE_FORMAT,
     MODE_CAMERAS,
     MODE_BUILTIN,
+    IMAGE_FORMAT_GIF,
+    IMAGE_FORMAT_JPEG,
 )
 
 
+# /v.json "m" field starts with the model name, e.g. "SmallTV-Ultra"
+_ULTRA_PREFIXES = ("SmallTV-Ultra",)
+_PRO_PREFIXES = ("SmallTV-PRO", "SmallTV Pro")
+
+
+@lru_cache(maxsize=16)
 def _device_type(model: str) -> str | None:
     """Return DEVICE_ULTRA / DEVICE_PRO based on /v.json model string, or None."""
-    if "SmallTV-Ultra" in model:
+    if model.startswith(_ULTRA_PREFIXES):
         return DEVICE_ULTRA
-    if "SmallTV-PRO" in model or "SmallTV Pro" in model:
+    if model.startswith(_PRO_PREFIXES):
         return DEVICE_PRO
     return None
 
 _SCAN_TIMEOUT = aiohttp.ClientTimeout(total=2)
 _SCAN_CONCURRENCY = 50
+# Bytes of a /v.json reply inspected before deciding to parse it
+_PROBE_READ_LIMIT = 512
+# Declared Content-Length above which a /v.json reply cannot be a SmallTV
+_PROBE_MAX_BODY = 2048
+# hass.data key for {subnet: devices found by the last sweep}, kept for the
+# HA session next to (not inside) the per-entry hass.data[DOMAIN]
+_SCAN_CACHE_KEY = f"{DOMAIN}_scan_cache"
+# Host suffixes .1–.254, built once at import
+_SCAN_SUFFIXES = tuple(f".{i}" for i in range(1, 255))
+# Plain TCP connect to port 80 before the HTTP probe; absent hosts fail fast.
+# Kept above the 200 ms a wired host needs so Wi-Fi power-save wakeups fit.
+_PORT_PROBE_TIMEOUT = 0.5
+
+
+async def _port_open(ip: str, port: int = 80) -> bool:
+    """Return True if *ip* accepts a TCP connection on *port* within the deadline."""
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(ip, port), _PORT_PROBE_TIMEOUT
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+
+async def _async_drain(
+    items: list[str], handle: Callable[[str], Awaitable[None]]
+) -> None:
+    """Run *handle* on every item from a fixed pool of _SCAN_CONCURRENCY workers.
+
+    A queue drained by the pool means at most that many tasks and sockets
+    exist at once, instead of one task per host.
+    """
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for item in items:
+        queue.put_nowait(item)
+
+    async def worker() -> None:
+        while not queue.empty():
+            await handle(queue.get_nowait())
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(min(_SCAN_CONCURRENCY, len(items))):
+            tg.create_task(worker())
+
+
+async def _async_probe_hosts(ips: list[str]) -> list[tuple[str, str, str]]:
+    """Return [(ip, firmware_version, device_type)] for SmallTV devices among *ips*."""
+    # Stage 1: TCP connect sweep, bounded by the same worker pool as stage 2
+    alive: list[str] = []
+
+    async def sweep(ip: str) -> None:
+        if await _port_open(ip):
+            alive.append(ip)
+
+    await _async_drain(ips, sweep)
+    if not alive:
+        return []
+
+    # Stage 2: HTTP /v.json probe of responsive hosts only, on a throwaway
+    # session.  The worker pool below bounds concurrency, so the connector is
+    # unlimited (no second queue, and no pool wait counted in _SCAN_TIMEOUT);
+    # IP literals skip DNS entirely, and force_close avoids keeping idle
+    # keep-alive sockets around
+    connector = aiohttp.TCPConnector(
+        limit=0,
+        limit_per_host=0,
+        force_close=True,
+        enable_cleanup_closed=True,
+    )
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=_SCAN_TIMEOUT
+    ) as session:
+
+        async def probe(ip: str) -> tuple[str, str, str] | None:
+            try:
+                async with session.get(f"http://{ip}/v.json") as resp:
+                    # /v.json is tiny: a large declared body is something else
+                    # (router/printer HTML) – reject before reading any of it
+                    if (resp.content_length or 0) > _PROBE_MAX_BODY:
+                        return None
+                    if resp.status == 200:
+                        # read() may return a short chunk – keep reading up
+                        # to the limit or EOF so the marker is never split
+                        body = b""
+                        while len(body) < _PROBE_READ_LIMIT and (
+                            chunk := await resp.content.read(
+                                _PROBE_READ_LIMIT - len(body)
+                            )
+                        ):
+                            body += chunk
+                        # Anything else serving that path is rejected on its
+                        # first bytes without a JSON parse
+                        if b"SmallTV" not in body:
+                            return None
+                        if not resp.content.at_eof():
+                            body += await resp.content.read()
+                        data = orjson.loads(body)
+                        dtype = _device_type(data.get("m", ""))
+                        if dtype is not None:
+                            return ip, data.get("v", "unknown"), dtype
+            except Exception:
+                pass
+            return None
+
+        found: list[tuple[str, str, str]] = []
+
+        async def collect(ip: str) -> None:
+            if (result := await probe(ip)) is not None:
+                found.append(result)
+
+        await _async_drain(alive, collect)
+    # Results arrive in completion order – sort once by last octet
+    found.sort(key=lambda t: int(t[0].rsplit(".", 1)[1]))
+    return found
+
+
+# Fixed config-flow schemas, compiled once at import
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required("method", default="scan"): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=["scan", "manual"],
+                mode=selector.SelectSelectorMode.LIST,
+                translation_key="add_method",
+            )
+        )
+    }
+)
+_SCAN_SCHEMA = vol.Schema({vol.Required("subnet", default="192.168.0"): str})
+_MANUAL_SCHEMA = vol.Schema({vol.Required(CONF_HOST): str})
 
 
 class SmallTVUltraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -49,6 +195,18 @@ class SmallTVUltraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         self._found: list[tuple[str, str, str]] = []  # (ip, firmware_version, device_type)
+        self._api_cache: dict[str, SmallTVApi] = {}
+        self._pick_schema: vol.Schema | None = None  # built from _found once per scan
+        self._subnet: str = ""
+        self._from_cache: bool = False  # _found came from the scan cache
+
+    def _api_for(self, host: str) -> SmallTVApi:
+        """Return the API client for *host*, reused across form retries."""
+        if (api := self._api_cache.get(host)) is None:
+            api = self._api_cache[host] = SmallTVApi(
+                host, async_get_clientsession(self.hass)
+            )
+        return api
 
     # ------------------------------------------------------------------ #
     # Step 1 – choose method                                               #
@@ -63,20 +221,7 @@ class SmallTVUltraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return await self.async_step_scan()
             return await self.async_step_manual()
 
-        return self.async_show_form(
-            step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("method", default="scan"): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=["scan", "manual"],
-                            mode=selector.SelectSelectorMode.LIST,
-                            translation_key="add_method",
-                        )
-                    )
-                }
-            ),
-        )
+        return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA)
 
     # ------------------------------------------------------------------ #
     # Step 2a – scan                                                       #
@@ -89,8 +234,14 @@ class SmallTVUltraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            subnet = user_input["subnet"].strip().rstrip(".")
-            self._found = await self._async_scan_subnet(subnet)
+            self._subnet = user_input["subnet"].strip().rstrip(".")
+            # Devices remembered for this subnet skip the full sweep, as long
+            # as every one of them still answers; pick offers a rescan
+            self._found = await self._async_check_cached(self._subnet)
+            self._from_cache = bool(self._found)
+            if not self._from_cache:
+                self._found = await self._async_scan_subnet(self._subnet)
+            self._pick_schema = None
             if not self._found:
                 errors["base"] = "no_devices_found"
             else:
@@ -98,9 +249,7 @@ class SmallTVUltraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="scan",
-            data_schema=vol.Schema(
-                {vol.Required("subnet", default="192.168.0"): str}
-            ),
+            data_schema=_SCAN_SCHEMA,
             errors=errors,
         )
 
@@ -112,7 +261,17 @@ class SmallTVUltraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict | None = None
     ) -> FlowResult:
         """Let the user pick one of the discovered SmallTV devices."""
-        if user_input is not None:
+        if user_input is not None and user_input.get("rescan"):
+            self._found = await self._async_scan_subnet(self._subnet)
+            self._from_cache = False
+            self._pick_schema = None
+            if not self._found:
+                return self.async_show_form(
+                    step_id="scan",
+                    data_schema=_SCAN_SCHEMA,
+                    errors={"base": "no_devices_found"},
+                )
+        elif user_input is not None:
             host = user_input[CONF_HOST]
             entry = next((t for t in self._found if t[0] == host), None)
             fw, dtype = (entry[1], entry[2]) if entry else ("", DEVICE_ULTRA)
@@ -124,22 +283,28 @@ class SmallTVUltraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data={CONF_HOST: host, CONF_DEVICE_TYPE: dtype},
             )
 
-        options = [
-            selector.SelectOptionDict(
-                value=ip,
-                label=f"{ip}  –  {'Pro' if dtype == DEVICE_PRO else 'Ultra'}  {fw}",
-            )
-            for ip, fw, dtype in sorted(self._found)
-        ]
+        if self._pick_schema is None:
+            # _found is already IP-sorted by the scan
+            options = [
+                selector.SelectOptionDict(
+                    value=ip,
+                    label=f"{ip}  –  {'Pro' if dtype == DEVICE_PRO else 'Ultra'}  {fw}",
+                )
+                for ip, fw, dtype in self._found
+            ]
+            schema: dict = {
+                vol.Required(CONF_HOST): selector.SelectSelector(
+                    selector.SelectSelectorConfig(options=options)
+                )
+            }
+            if self._from_cache:
+                schema[vol.Optional("rescan", default=False)] = (
+                    selector.BooleanSelector()
+                )
+            self._pick_schema = vol.Schema(schema)
         return self.async_show_form(
             step_id="pick",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_HOST): selector.SelectSelector(
-                        selector.SelectSelectorConfig(options=options)
-                    )
-                }
-            ),
+            data_schema=self._pick_schema,
         )
 
     # ------------------------------------------------------------------ #
@@ -154,8 +319,7 @@ class SmallTVUltraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             host = user_input[CONF_HOST].strip()
-            session = async_get_clientsession(self.hass)
-            api = SmallTVApi(host, session)
+            api = self._api_for(host)
             try:
                 info = await api.get_info()
                 dtype = _device_type(info.get("m", ""))
@@ -174,7 +338,7 @@ class SmallTVUltraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="manual",
-            data_schema=vol.Schema({vol.Required(CONF_HOST): str}),
+            data_schema=_MANUAL_SCHEMA,
             errors=errors,
         )
 
@@ -190,8 +354,7 @@ class SmallTVUltraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             host = user_input[CONF_HOST].strip()
-            session = async_get_clientsession(self.hass)
-            api = SmallTVApi(host, session)
+            api = self._api_for(host)
             try:
                 info = await api.get_info()
                 dtype = _device_type(info.get("m", ""))
@@ -234,37 +397,61 @@ class SmallTVUltraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     # Subnet scanner                                                       #
     # ------------------------------------------------------------------ #
 
-    async def _async_scan_subnet(self, subnet: str) -> list[tuple[str, str, str]]:
-        """Probe subnet.1–254 concurrently; return [(ip, firmware_version, device_type)]."""
-        session = async_get_clientsession(self.hass)
-        sem = asyncio.Semaphore(_SCAN_CONCURRENCY)
+    async def _async_check_cached(self, subnet: str) -> list[tuple[str, str, str]]:
+        """Re-probe the devices the last sweep found on *subnet*.
 
-        async def probe(ip: str) -> tuple[str, str, str] | None:
-            async with sem:
-                try:
-                    async with session.get(
-                        f"http://{ip}/v.json",
-                        timeout=_SCAN_TIMEOUT,
-                    ) as resp:
-                        if resp.status == 200:
-                            data = await resp.json(content_type=None)
-                            dtype = _device_type(data.get("m", ""))
-                            if dtype is not None:
-                                return ip, data.get("v", "unknown"), dtype
-                except Exception:
-                    pass
-            return None
+        Returns them refreshed if all still answer, else [] (a device may
+        have moved, so only a full sweep gives a complete list).
+        """
+        cached = self.hass.data.get(_SCAN_CACHE_KEY, {}).get(subnet)
+        if not cached:
+            return []
+        found = await _async_probe_hosts([ip for ip, _, _ in cached])
+        return found if len(found) == len(cached) else []
 
-        results = await asyncio.gather(
-            *[probe(f"{subnet}.{i}") for i in range(1, 255)]
-        )
-        return [r for r in results if r is not None]
+    async def _async_scan_subnet(self, subnet: str) -> list[tuple[str, str, str]]:
+        """Probe subnet.1–254 concurrently; return [(ip, firmware_version, device_type)]."""
+        found = await _async_probe_hosts([subnet + suffix for suffix in _SCAN_SUFFIXES])
+        self.hass.data.setdefault(_SCAN_CACHE_KEY, {})[subnet] = found
+        return found
 
 
 # --------------------------------------------------------------------------- #
 # Options flow                                                                 #
 # --------------------------------------------------------------------------- #
 
+# Selectors are stateless; only the defaults change between renders
+_CAMERAS_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="camera", multiple=True)
+)
+_REFRESH_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=60, max=3600, step=1, unit_of_measurement="s",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_CYCLE_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1, max=10, step=1, unit_of_measurement="s",
+        mode=selector.NumberSelectorMode.SLIDER,
+    )
+)
+_MODE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[MODE_CAMERAS, MODE_BUILTIN],
+        mode=selector.SelectSelectorMode.LIST,
+        translation_key="display_mode",
+    )
+)
+_IMAGE_FORMAT_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[IMAGE_FORMAT_GIF, IMAGE_FORMAT_JPEG],
+        mode=selector.SelectSelectorMode.LIST,
+        translation_key="image_format",
+    )
+)
+
+
 class SmallTVUltraOptionsFlow(config_entries.OptionsFlow):
     """Handle options for an existing SmallTV Ultra entry."""
 
@@ -279,35 +466,21 @@ class SmallTVUltraOptionsFlow(config_entries.OptionsFlow):
         current_refresh: int = opts.get(CONF_REFRESH_INTERVAL, DEFAULT_REFRESH_INTERVAL)
         current_cycle: int = opts.get(CONF_CYCLE_INTERVAL, DEFAULT_CYCLE_INTERVAL)
         current_mode: str = opts.get(CONF_MODE, DEFAULT_MODE)
+        current_format: str = opts.get(CONF_IMAGE_FORMAT, DEFAULT_IMAGE_FORMAT)
 
         schema = vol.Schema(
             {
-                vol.Optional(CONF_CAMERAS, default=current_cameras): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="camera", multiple=True)
-                ),
+                vol.Optional(CONF_CAMERAS, default=current_cameras): _CAMERAS_SELECTOR,
                 vol.Optional(
                     CONF_REFRESH_INTERVAL, default=current_refresh
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=60, max=3600, step=1, unit_of_measurement="s",
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
+                ): _REFRESH_SELECTOR,
                 vol.Optional(
                     CONF_CYCLE_INTERVAL, default=current_cycle
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1, max=10, step=1, unit_of_measurement="s",
-                        mode=selector.NumberSelectorMode.SLIDER,
-                    )
-                ),
-                vol.Optional(CONF_MODE, default=current_mode): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[MODE_CAMERAS, MODE_BUILTIN],
-                        mode=selector.SelectSelectorMode.LIST,
-                        translation_key="display_mode",
-                    )
-                ),
+                ): _CYCLE_SELECTOR,
+                vol.Optional(CONF_MODE, default=current_mode): _MODE_SELECTOR,
+                vol.Optional(
+                    CONF_IMAGE_FORMAT, default=current_format
+                ): _IMAGE_FORMAT_SELECTOR,
             }
         )
 
@@ -1,4 +1,7 @@
 """Constants for SmallTV Ultra integration."""
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Final
 
 DOMAIN = "smalltv_ultra"
 
@@ -7,14 +10,25 @@ CONF_CAMERAS = "cameras"
 CONF_REFRESH_INTERVAL = "refresh_interval"
 CONF_CYCLE_INTERVAL = "cycle_interval"
 CONF_MODE = "mode"
+CONF_IMAGE_FORMAT = "image_format"
 
 DEFAULT_REFRESH_INTERVAL = 300  # seconds
 DEFAULT_CYCLE_INTERVAL = 1      # seconds
 DEFAULT_MODE = "cameras"
+DEFAULT_IMAGE_FORMAT = "gif"
 
 MODE_CAMERAS = "cameras"
 MODE_BUILTIN = "builtin"
 
+# Firmware theme applied for each display mode:
+# 3 = Photo Album (required for image display), 1 = Weather Clock Today
+MODE_TO_THEME: Final[Mapping[str, int]] = MappingProxyType(
+    {MODE_CAMERAS: 3, MODE_BUILTIN: 1}
+)
+
+IMAGE_FORMAT_GIF = "gif"    # one animated GIF, frames cycled by the GIF itself
+IMAGE_FORMAT_JPEG = "jpeg"  # one JPEG per camera, cycled by the Photo Album
+
 CONF_DEVICE_TYPE = "device_type"
 DEVICE_ULTRA = "ultra"
 DEVICE_PRO = "pro"
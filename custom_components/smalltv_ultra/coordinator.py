@@ -1,7 +1,12 @@
 """DataUpdateCoordinator for SmallTV Ultra."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from typing import Any
 
@@ -16,17 +21,33 @@ from .const import (
     CONF_CAMERAS,
     CONF_CYCLE_INTERVAL,
     CONF_MODE,
+    CONF_IMAGE_FORMAT,
     CONF_DEVICE_TYPE,
     DEVICE_PRO,
     DEFAULT_CYCLE_INTERVAL,
     DEFAULT_MODE,
+    DEFAULT_IMAGE_FORMAT,
+    IMAGE_FORMAT_JPEG,
     MODE_CAMERAS,
     MODE_BUILTIN,
+    MODE_TO_THEME,
 )
 from . import image_processor
 
 _LOGGER = logging.getLogger(__name__)
 
+# Adaptive builtin-mode polling: remember this many gaps between observed
+# state changes, poll this many times per expected gap, never slower than max
+_CHANGE_HISTORY = 16
+_POLLS_PER_CHANGE = 4
+_MAX_ADAPTIVE_INTERVAL = timedelta(hours=1)
+
+# Threads for per-frame image processing (see image_processor._process_frames)
+_FRAME_WORKERS = 4
+
+# Firmware version (/v.json) only changes on a device update
+INFO_UPDATE_INTERVAL = timedelta(hours=1)
+
 
 class SmallTVUltraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Manages periodic image upload and state tracking for a SmallTV Ultra device."""
@@ -40,10 +61,23 @@ class SmallTVUltraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     ) -> None:
         self.api = api
         self.entry = entry
-        self._firmware_version: str = "unknown"
         self._is_pro: bool = entry.data.get(CONF_DEVICE_TYPE) == DEVICE_PRO
         # Flag: True means we need to (re-)send theme + clear on next run
         self._needs_album_init: bool = True
+        # Digest of the frames behind the last successful upload
+        self._last_frame_hash: bytes | None = None
+        # Number of camN.jpg files on the device (JPEG image format)
+        self._last_jpeg_count: int = 0
+        # Long-lived pool for per-frame decode/resize inside the encode job,
+        # instead of spinning up fresh threads on every refresh
+        self._frame_executor = ThreadPoolExecutor(
+            max_workers=_FRAME_WORKERS, thread_name_prefix=f"{DOMAIN}_frames"
+        )
+        # Change tracking for adaptive polling in builtin mode
+        self._base_interval = update_interval
+        self._last_status: dict[str, Any] | None = None
+        self._last_change: float = 0.0
+        self._change_gaps: deque[float] = deque(maxlen=_CHANGE_HISTORY)
 
         super().__init__(
             hass,
@@ -52,10 +86,6 @@ class SmallTVUltraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=update_interval,
         )
 
-    @property
-    def firmware_version(self) -> str:
-        return self._firmware_version
-
     @property
     def is_pro(self) -> bool:
         return self._is_pro
@@ -66,13 +96,6 @@ class SmallTVUltraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch fresh data / push images.  Called by HA on every interval."""
-        # Always fetch device info so we have the firmware version
-        try:
-            info = await self.api.get_info()
-            self._firmware_version = info.get("v", "unknown")
-        except SmallTVApiError as err:
-            raise UpdateFailed(f"Cannot reach SmallTV Ultra: {err}") from err
-
         opts = self.entry.options
         mode: str = opts.get(CONF_MODE, DEFAULT_MODE)
         cycle_interval: int = int(opts.get(CONF_CYCLE_INTERVAL, DEFAULT_CYCLE_INTERVAL))
@@ -82,56 +105,110 @@ class SmallTVUltraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._needs_album_init = True  # Re-init next time we switch to cameras
             if self._is_pro:
                 # Pro has no /app.json – just report builtin mode without theme info
+                await self._async_ping()
                 return {"mode": MODE_BUILTIN, "theme": 1}
             try:
                 app_info = await self.api.get_app_info()
             except SmallTVApiError as err:
                 raise UpdateFailed(f"Cannot get app info: {err}") from err
-            return {"mode": MODE_BUILTIN, "theme": app_info.get("theme", 1)}
+            data = {"mode": MODE_BUILTIN, "theme": app_info.get("theme", 1)}
+            self._adapt_interval(data)
+            return data
 
         # ---- MODE_CAMERAS ----
         if not cameras:
             _LOGGER.debug("No cameras configured – skipping upload")
+            await self._async_ping()
             return {"mode": MODE_CAMERAS, "cameras": []}
 
-        # Collect raw frames from all configured cameras
+        # Collect raw frames from all configured cameras concurrently
+        results = await asyncio.gather(
+            *(async_get_image(self.hass, entity_id) for entity_id in cameras),
+            return_exceptions=True,
+        )
         frames: list[tuple[bytes, str]] = []
-        for entity_id in cameras:
-            try:
-                img_obj = await async_get_image(self.hass, entity_id)
-                label = entity_id.split(".", 1)[-1].replace("_", " ")
-                frames.append((img_obj.content, label))
-            except Exception as err:  # noqa: BLE001
-                _LOGGER.warning("Failed to fetch camera '%s': %s", entity_id, err)
+        for entity_id, result in zip(cameras, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Failed to fetch camera '%s': %s", entity_id, result)
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            label = entity_id.split(".", 1)[-1].replace("_", " ")
+            frames.append((result.content, label))
 
         if not frames:
             _LOGGER.debug("No camera frames available – skipping upload")
+            await self._async_ping()
             return {"mode": MODE_CAMERAS, "cameras": []}
 
+        labels = [label for _, label in frames]
+
+        # Unchanged snapshots (e.g. static scenes at night): skip encode + upload
+        digest = hashlib.blake2b(digest_size=16)
+        for raw_bytes, label in frames:
+            digest.update(raw_bytes)
+            digest.update(label.encode())
+        frame_hash = digest.digest()
+        if frame_hash == self._last_frame_hash and not self._needs_album_init:
+            _LOGGER.debug("Camera frames unchanged – skipping upload")
+            await self._async_ping()
+            return {"mode": MODE_CAMERAS, "cameras": labels}
+
+        if opts.get(CONF_IMAGE_FORMAT, DEFAULT_IMAGE_FORMAT) == IMAGE_FORMAT_JPEG:
+            pushed = await self._async_push_jpegs(frames, cycle_interval)
+        else:
+            pushed = await self._async_push_gif(frames, cycle_interval)
+        if not pushed:
+            return {"mode": MODE_CAMERAS, "cameras": []}
+
+        self._needs_album_init = False
+        self._last_frame_hash = frame_hash
+        return {"mode": MODE_CAMERAS, "cameras": labels}
+
+    async def _async_ping(self) -> None:
+        """Reachability check for polls that send nothing else to the device.
+
+        get_info() on /v.json: a HEAD once Last-Modified is known, else (or
+        on HEAD failure) a conditional GET – both bodyless when unchanged.
+        """
+        try:
+            await self.api.get_info()
+        except SmallTVApiError as err:
+            raise UpdateFailed(f"Cannot reach SmallTV Ultra: {err}") from err
+
+    async def _async_init_album(self) -> None:
+        """Switch to Photo Album and clear old files (first run / mode switch)."""
+        try:
+            await self.api.set_theme(MODE_TO_THEME[MODE_CAMERAS])
+            await self.api.clear_images()
+            _LOGGER.debug("Switched to Photo Album mode, cleared old images")
+        except SmallTVApiError as err:
+            _LOGGER.warning("Failed to initialise Photo Album: %s", err)
+
+    async def _async_push_gif(
+        self, frames: list[tuple[bytes, str]], cycle_interval: int
+    ) -> bool:
+        """Upload all frames as one animated GIF; False if encoding failed."""
         # Build animated GIF in thread executor (CPU-bound)
         try:
             gif_bytes: bytes = await self.hass.async_add_executor_job(
                 image_processor.create_camera_gif,
                 frames,
                 cycle_interval,
+                None,
+                self._frame_executor,
             )
         except Exception as err:  # noqa: BLE001
             _LOGGER.warning("Failed to create GIF: %s", err)
-            return {"mode": MODE_CAMERAS, "cameras": []}
+            return False
 
         _LOGGER.debug(
             "Created GIF: %d frames, %d bytes, %ds/frame",
             len(frames), len(gif_bytes), cycle_interval,
         )
 
-        # On first run (or after mode switch): switch to Photo Album and clear old files
         if self._needs_album_init:
-            try:
-                await self.api.set_theme(3)
-                await self.api.clear_images()
-                _LOGGER.debug("Switched to Photo Album mode, cleared old images")
-            except SmallTVApiError as err:
-                _LOGGER.warning("Failed to initialise GIF mode: %s", err)
+            await self._async_init_album()
 
         # Upload the GIF and tell the device to display it
         try:
@@ -143,18 +220,103 @@ class SmallTVUltraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     await self.api.set_album_options(cycle_interval, 1)
                 except SmallTVApiError:
                     pass
-            self._needs_album_init = False
             _LOGGER.debug("GIF uploaded and displayed")
         except SmallTVApiError as err:
-            _LOGGER.warning("Failed to upload/display GIF: %s", err)
+            # No separate ping here – a failed upload is the unreachable signal
+            raise UpdateFailed(f"Failed to upload/display GIF: {err}") from err
+        return True
 
-        return {"mode": MODE_CAMERAS, "cameras": [label for _, label in frames]}
+    async def _async_push_jpegs(
+        self, frames: list[tuple[bytes, str]], cycle_interval: int
+    ) -> bool:
+        """Upload one JPEG per camera for the Photo Album to cycle; False if encoding failed."""
+        try:
+            jpegs: list[bytes] = await self.hass.async_add_executor_job(
+                image_processor.create_camera_jpegs, frames, None, self._frame_executor
+            )
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Failed to create JPEGs: %s", err)
+            return False
+
+        # The album shows every file in /image/, so a changed camera count
+        # needs a clear too – otherwise stale camN.jpg files keep cycling
+        needs_init = self._needs_album_init or len(jpegs) != self._last_jpeg_count
+        if needs_init:
+            await self._async_init_album()
+
+        try:
+            for i, jpeg in enumerate(jpegs, start=1):
+                await self.api.upload_image(f"cam{i}.jpg", jpeg)
+            if needs_init:
+                # Album autoplay does the cycling at cycle_interval
+                await self.api.set_album_options(cycle_interval, 1)
+            _LOGGER.debug("Uploaded %d JPEGs, %ds/image", len(jpegs), cycle_interval)
+        except SmallTVApiError as err:
+            raise UpdateFailed(f"Failed to upload JPEGs: {err}") from err
+        self._last_jpeg_count = len(jpegs)
+        return True
+
+    def _adapt_interval(self, data: dict[str, Any]) -> None:
+        """Stretch the poll interval while the builtin-mode state is stable.
+
+        Nothing is uploaded in builtin mode, so polling only tracks the theme.
+        The next interval is the median observed gap between changes (the
+        still-open gap counts as a lower bound) split into _POLLS_PER_CHANGE
+        polls, clamped between the configured refresh interval and
+        _MAX_ADAPTIVE_INTERVAL.
+
+        The configured refresh interval is a floor, not a ceiling: a stable
+        builtin-mode Ultra may be polled (and found unavailable) up to
+        _MAX_ADAPTIVE_INTERVAL apart.  Camera mode and the Pro (no /app.json)
+        always use the configured value.
+        """
+        now = time.monotonic()
+        if data != self._last_status:
+            if self._last_status is not None:
+                self._change_gaps.append(now - self._last_change)
+            self._last_status = data
+            self._last_change = now
+
+        gaps = sorted([*self._change_gaps, now - self._last_change])
+        expected = timedelta(seconds=gaps[len(gaps) // 2] / _POLLS_PER_CHANGE)
+        # Configured interval = floor; the adaptive cap is the ceiling
+        upper = max(self._base_interval, _MAX_ADAPTIVE_INTERVAL)
+        self.update_interval = min(max(expected, self._base_interval), upper)
 
     # ------------------------------------------------------------------ #
     # Public helpers (called by entity platforms)                          #
     # ------------------------------------------------------------------ #
 
+    async def async_shutdown(self) -> None:
+        """Stop polling and release the frame-processing threads."""
+        await super().async_shutdown()
+        self._frame_executor.shutdown(wait=False, cancel_futures=True)
+
     async def async_force_refresh(self) -> None:
         """Trigger an immediate update (e.g. from Force Refresh button)."""
         self._needs_album_init = True
         await self.async_refresh()
+
+
+class SmallTVInfoCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Polls /v.json (model + firmware version) on a slow, fixed interval."""
+
+    def __init__(self, hass: HomeAssistant, api: SmallTVApi) -> None:
+        self.api = api
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_info",
+            update_interval=INFO_UPDATE_INTERVAL,
+        )
+
+    @property
+    def firmware_version(self) -> str:
+        return (self.data or {}).get("v", "unknown")
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        try:
+            return await self.api.get_info()
+        except SmallTVApiError as err:
+            raise UpdateFailed(f"Cannot reach SmallTV Ultra: {err}") from err
@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import io
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -15,10 +18,22 @@ _FONT_CANDIDATES = [
 _FONT_SIZE = 20
 _LABEL_BAR_HEIGHT = 30
 _DISPLAY_SIZE = 240
+_MAX_FRAME_WORKERS = 8
+# GIFs larger than this are re-encoded with optimize=True
+_GIF_OPTIMIZE_THRESHOLD = 256 * 1024
+_BAR_TOP = _DISPLAY_SIZE - _LABEL_BAR_HEIGHT
+_BAR_BOX = (0, _BAR_TOP, _DISPLAY_SIZE, _DISPLAY_SIZE)
+_BAR_ALPHA = 160 / 255
+# Blend target for the label bar – identical for every frame, built once
+_BAR_BLACK = Image.new("RGB", (_DISPLAY_SIZE, _LABEL_BAR_HEIGHT), (0, 0, 0))
 
 
+@lru_cache(maxsize=8)
 def _load_font(font_path: str | None = None) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
-    """Load a TrueType font, falling back gracefully to the built-in bitmap font."""
+    """Load a TrueType font, falling back gracefully to the built-in bitmap font.
+
+    Cached per font_path: the candidate search and TTF parse run once per process.
+    """
     candidates = ([font_path] if font_path else []) + _FONT_CANDIDATES
     for path in candidates:
         if path is None:
@@ -30,13 +45,33 @@ def _load_font(font_path: str | None = None) -> ImageFont.FreeTypeFont | ImageFo
     return ImageFont.load_default()
 
 
+@lru_cache(maxsize=64)
+def _text_extent(
+    text: str, font: ImageFont.FreeTypeFont | ImageFont.ImageFont
+) -> tuple[int, int]:
+    """Return (width, height) of *text* in *font*.
+
+    Labels and fonts are stable across refreshes (fonts come from the
+    _load_font cache and hash by identity), so each label is measured once.
+    """
+    bbox = font.getbbox(text)
+    return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+
 def _process_frame(
     raw_bytes: bytes,
     label: str,
     font: ImageFont.FreeTypeFont | ImageFont.ImageFont | None = None,
 ) -> Image.Image:
     """Return a 240×240 RGB PIL Image ready for export (JPEG or GIF frame)."""
-    img = Image.open(io.BytesIO(raw_bytes)).convert("RGB")
+    img = Image.open(io.BytesIO(raw_bytes))
+    # JPEG only: let the decoder scale down by 1/2–1/8 while decoding, as long
+    # as the shorter side stays >= the display size – skips decoding and
+    # converting full-resolution pixels that the resize would throw away
+    w, h = img.size
+    side = min(w, h)
+    img.draft("RGB", (-(-_DISPLAY_SIZE * w // side), -(-_DISPLAY_SIZE * h // side)))
+    img = img.convert("RGB")
 
     # Center crop to square
     w, h = img.size
@@ -45,31 +80,49 @@ def _process_frame(
     top = (h - side) // 2
     img = img.crop((left, top, left + side, top + side))
 
-    # Resize to display resolution
-    img = img.resize((_DISPLAY_SIZE, _DISPLAY_SIZE), Image.LANCZOS)
+    # Resize to display resolution.  draft() already left JPEGs under 2× the
+    # target, where BILINEAR is enough; reducing_gap gives other (non-draftable)
+    # large inputs the same integer box pre-reduction before the final pass
+    img = img.resize(
+        (_DISPLAY_SIZE, _DISPLAY_SIZE), Image.BILINEAR, reducing_gap=2.0
+    )
 
-    # Semi-transparent label bar at bottom (RGBA composite)
-    overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
-    bar_top = _DISPLAY_SIZE - _LABEL_BAR_HEIGHT
-    draw.rectangle([(0, bar_top), (_DISPLAY_SIZE, _DISPLAY_SIZE)], fill=(0, 0, 0, 160))
+    # Semi-transparent label bar at bottom: darken only the bar strip in
+    # place (equivalent to compositing black at alpha 160) instead of
+    # alpha-compositing a full-size RGBA overlay
+    img.paste(Image.blend(img.crop(_BAR_BOX), _BAR_BLACK, _BAR_ALPHA), _BAR_BOX)
 
     if font is None:
         font = _load_font()
+    draw = ImageDraw.Draw(img)
     text = label[:22]
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_w = bbox[2] - bbox[0]
-    text_h = bbox[3] - bbox[1]
+    text_w, text_h = _text_extent(text, font)
     draw.text(
-        ((_DISPLAY_SIZE - text_w) // 2, bar_top + (_LABEL_BAR_HEIGHT - text_h) // 2),
+        ((_DISPLAY_SIZE - text_w) // 2, _BAR_TOP + (_LABEL_BAR_HEIGHT - text_h) // 2),
         text,
-        fill=(255, 255, 255, 255),
+        fill=(255, 255, 255),
         font=font,
     )
+    return img
 
-    img = img.convert("RGBA")
-    img = Image.alpha_composite(img, overlay)
-    return img.convert("RGB")
+
+def _process_frames(
+    frames: list[tuple[bytes, str]],
+    font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
+    executor: Executor | None = None,
+) -> list[Image.Image]:
+    """Run _process_frame over all (raw_bytes, label) pairs in parallel threads.
+
+    Pillow releases the GIL while decoding/resizing, so this parallelises
+    while staying inside the caller's single executor job.  Uses *executor*
+    when given (a long-lived pool owned by the caller), else a temporary pool.
+    """
+    raws = [raw_bytes for raw_bytes, _ in frames]
+    labels = [label for _, label in frames]
+    if executor is not None:
+        return list(executor.map(_process_frame, raws, labels, repeat(font)))
+    with ThreadPoolExecutor(max_workers=min(_MAX_FRAME_WORKERS, len(frames))) as pool:
+        return list(pool.map(_process_frame, raws, labels, repeat(font)))
 
 
 def process_camera_image(
@@ -92,6 +145,7 @@ def create_camera_gif(
     frames: list[tuple[bytes, str]],
     frame_duration_s: int = 3,
     font_path: str | None = None,
+    executor: Executor | None = None,
 ) -> bytes:
     """Build an animated GIF containing one frame per camera.
 
@@ -99,28 +153,65 @@ def create_camera_gif(
         frames: list of (raw_image_bytes, label) tuples, one per camera.
         frame_duration_s: how long each frame is shown (seconds).
         font_path: optional custom font path.
+        executor: optional long-lived thread pool for per-frame processing.
 
     Returns GIF bytes.  CPU-bound – call via ``hass.async_add_executor_job()``.
     """
-    font = _load_font(font_path)  # load once for all frames
-    pil_frames: list[Image.Image] = []
-    for raw_bytes, label in frames:
-        pil_frames.append(_process_frame(raw_bytes, label, font))
-
-    if not pil_frames:
+    if not frames:
         raise ValueError("No frames to encode")
 
-    # Quantize each frame to 256-colour palette for GIF
-    quantized = [f.quantize(colors=256, method=Image.Quantize.MEDIANCUT) for f in pil_frames]
+    pil_frames = _process_frames(frames, _load_font(font_path), executor)
+
+    # Build one 256-colour palette from all frames side by side (fast octree),
+    # then map every frame onto it: the GIF gets a single global colour table
+    # instead of one local table per frame.  No dithering – not worth the cost
+    # on a 240×240 labelled still.
+    strip = Image.new("RGB", (_DISPLAY_SIZE * len(pil_frames), _DISPLAY_SIZE))
+    for i, f in enumerate(pil_frames):
+        strip.paste(f, (i * _DISPLAY_SIZE, 0))
+    palette = strip.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+    quantized = [f.quantize(palette=palette, dither=Image.Dither.NONE) for f in pil_frames]
+
+    def encode(optimize: bool) -> bytes:
+        out = io.BytesIO()
+        quantized[0].save(
+            out,
+            format="GIF",
+            save_all=True,
+            append_images=quantized[1:],
+            duration=frame_duration_s * 1000,  # GIF uses milliseconds
+            loop=0,                             # loop forever
+            optimize=optimize,
+        )
+        return out.getvalue()
+
+    # The optimizer pass is slow and saves little on a LAN; only pay for it
+    # when the GIF is big enough to matter for the device's flash
+    gif = encode(optimize=False)
+    if len(gif) > _GIF_OPTIMIZE_THRESHOLD:
+        gif = encode(optimize=True)
+    return gif
+
+
+def create_camera_jpegs(
+    frames: list[tuple[bytes, str]],
+    font_path: str | None = None,
+    executor: Executor | None = None,
+) -> list[bytes]:
+    """Build one 240×240 JPEG per camera for the device's Photo Album to cycle.
 
-    out = io.BytesIO()
-    quantized[0].save(
-        out,
-        format="GIF",
-        save_all=True,
-        append_images=quantized[1:],
-        duration=frame_duration_s * 1000,  # GIF uses milliseconds
-        loop=0,                             # loop forever
-        optimize=True,
-    )
-    return out.getvalue()
+    Skips palette quantization and LZW encoding entirely; ``optimize`` is left
+    off since the extra Huffman pass saves only a few percent.
+
+    Returns a list of JPEG bytes.  CPU-bound – call via
+    ``hass.async_add_executor_job()``.
+    """
+    if not frames:
+        raise ValueError("No frames to encode")
+
+    jpegs: list[bytes] = []
+    for img in _process_frames(frames, _load_font(font_path), executor):
+        out = io.BytesIO()
+        img.save(out, format="JPEG", quality=85)
+        jpegs.append(out.getvalue())
+    return jpegs
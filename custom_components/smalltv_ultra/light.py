@@ -13,7 +13,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, CONF_HOST
-from .coordinator import SmallTVUltraCoordinator
+from .coordinator import SmallTVInfoCoordinator, SmallTVUltraCoordinator
 
 
 async def async_setup_entry(
@@ -21,8 +21,10 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    coordinator: SmallTVUltraCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([SmallTVUltraLight(coordinator, entry)])
+    coordinators = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        [SmallTVUltraLight(coordinators["status"], coordinators["info"], entry)]
+    )
 
 
 class SmallTVUltraLight(CoordinatorEntity[SmallTVUltraCoordinator], LightEntity):
@@ -35,9 +37,13 @@ class SmallTVUltraLight(CoordinatorEntity[SmallTVUltraCoordinator], LightEntity)
     _attr_name = "Brightness"
 
     def __init__(
-        self, coordinator: SmallTVUltraCoordinator, entry: ConfigEntry
+        self,
+        coordinator: SmallTVUltraCoordinator,
+        info_coordinator: SmallTVInfoCoordinator,
+        entry: ConfigEntry,
     ) -> None:
         super().__init__(coordinator)
+        self._info_coordinator = info_coordinator
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_brightness"
         # Track state locally; the device has no endpoint to read brightness back
@@ -52,7 +58,7 @@ class SmallTVUltraLight(CoordinatorEntity[SmallTVUltraCoordinator], LightEntity)
             name=model,
             manufacturer="GeekMagic",
             model=model,
-            sw_version=self.coordinator.firmware_version,
+            sw_version=self._info_coordinator.firmware_version,
             configuration_url=f"http://{self._entry.data[CONF_HOST]}",
         )
 
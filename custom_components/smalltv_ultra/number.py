@@ -23,7 +23,7 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    coordinator: SmallTVUltraCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: SmallTVUltraCoordinator = hass.data[DOMAIN][entry.entry_id]["status"]
     async_add_entities(
         [
             SmallTVRefreshIntervalNumber(coordinator, entry),
@@ -44,17 +44,16 @@ class _SmallTVBaseNumber(CoordinatorEntity[SmallTVUltraCoordinator], NumberEntit
     ) -> None:
         super().__init__(coordinator)
         self._entry = entry
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self._entry.entry_id)})
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry.entry_id)})
 
 
 class SmallTVRefreshIntervalNumber(_SmallTVBaseNumber):
     """How often (seconds) HA fetches camera images and uploads them.
 
     Stored in config entry options; changing it reloads the integration
-    so the coordinator update_interval is applied immediately.
+    so the coordinator update_interval is applied immediately.  On an Ultra
+    in builtin mode it is only the minimum poll interval: the coordinator
+    stretches polling up to 1 h while the device state stays unchanged.
     """
 
     _attr_name = "Refresh Interval"
@@ -1,6 +1,8 @@
 """SmallTV Ultra select entity – display mode (cameras / builtin)."""
 from __future__ import annotations
 
+import logging
+
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -8,22 +10,26 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import SmallTVApiError
 from .const import (
     DOMAIN,
     CONF_MODE,
     DEFAULT_MODE,
     MODE_CAMERAS,
     MODE_BUILTIN,
+    MODE_TO_THEME,
 )
 from .coordinator import SmallTVUltraCoordinator
 
+_LOGGER = logging.getLogger(__name__)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    coordinator: SmallTVUltraCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: SmallTVUltraCoordinator = hass.data[DOMAIN][entry.entry_id]["status"]
     async_add_entities([SmallTVDisplayModeSelect(coordinator, entry)])
 
 
@@ -35,6 +41,8 @@ class SmallTVDisplayModeSelect(
     _attr_has_entity_name = True
     _attr_name = "Display Mode"
     _attr_icon = "mdi:television-play"
+    # One list shared by every instance – HA types options as list[str], so
+    # it stays a list and is treated as read-only
     _attr_options = [MODE_CAMERAS, MODE_BUILTIN]
 
     def __init__(
@@ -43,28 +51,27 @@ class SmallTVDisplayModeSelect(
         super().__init__(coordinator)
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_display_mode"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self._entry.entry_id)})
-
-    @property
-    def current_option(self) -> str:
-        return self._entry.options.get(CONF_MODE, DEFAULT_MODE)
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry.entry_id)})
+        # Options changes reload the entry, so this read is never stale
+        self._attr_current_option = entry.options.get(CONF_MODE, DEFAULT_MODE)
 
     async def async_select_option(self, option: str) -> None:
-        """Apply the new mode: flip the firmware theme, then re-trigger the coordinator."""
-        new_options = {**self._entry.options, CONF_MODE: option}
-        self.hass.config_entries.async_update_entry(self._entry, options=new_options)
+        """Apply the new mode: flip the firmware theme, then store it in the entry."""
+        if option == self._attr_current_option:
+            return  # Already active – no HTTP call or entry reload
+        self._attr_current_option = option
 
         try:
-            if option == MODE_CAMERAS:
-                # Switch device to Photo Album so images can be displayed
-                await self.coordinator.api.set_theme(3)
-            else:
-                # Revert to Weather Clock Today (theme 1) as the default builtin
-                await self.coordinator.api.set_theme(1)
-        except Exception:  # noqa: BLE001
-            pass  # Best-effort; coordinator will handle state on next refresh
+            theme_id = MODE_TO_THEME.get(option)
+            if theme_id is not None:
+                await self.coordinator.api.set_theme(theme_id)
+        except SmallTVApiError as err:
+            # Best-effort; coordinator will handle state on next refresh
+            _LOGGER.debug("set_theme failed: %s", err)
 
-        await self.coordinator.async_force_refresh()
+        # Saving the option reloads the entry (see _async_update_listener);
+        # the fresh coordinator re-inits the album and polls the new mode.
+        # Done after set_theme so that first poll cannot read the old theme
+        new_options = dict(self._entry.options)
+        new_options[CONF_MODE] = option
+        self.hass.config_entries.async_update_entry(self._entry, options=new_options)